@@ -1,149 +0,0 @@
-#!/usr/bin/env python3
-"""
-Complete End-to-End System Test
-Tests all features working together
-"""
-
-import requests
-import json
-import time
-
-def test_complete_system():
-    """Test complete end-to-end functionality"""
-    print("COMPLETE END-TO-END SYSTEM TEST")
-    print("=" * 60)
-    
-    base_url = "http://localhost:8000"
-    frontend_url = "http://localhost:3000"
-    
-    # Test 1: Backend Health
-    print("\n1. Testing Backend Health...")
-    try:
-        response = requests.get(f"{base_url}/health")
-        if response.status_code == 200:
-            print("SUCCESS: Backend is healthy")
-        else:
-            print("ERROR: Backend health check failed")
-            return False
-    except Exception as e:
-        print(f"ERROR: Backend connection failed: {e}")
-        return False
-    
-    # Test 2: Frontend Accessibility
-    print("\n2. Testing Frontend Accessibility...")
-    try:
-        response = requests.get(frontend_url, timeout=5)
-        if response.status_code == 200:
-            print("SUCCESS: Frontend is accessible")
-        else:
-            print("ERROR: Frontend not accessible")
-            return False
-    except Exception as e:
-        print(f"ERROR: Frontend connection failed: {e}")
-        return False
-    
-    # Test 3: Product Recommendations
-    print("\n3. Testing Product Recommendations...")
-    test_queries = [
-        "modern sofa",
-        "leather chair",
-        "wooden table",
-        "office furniture"
-    ]
-    
-    for query in test_queries:
-        try:
-            response = requests.post(
-                f"{base_url}/api/v1/recommendations/",
-                json={"query": query, "top_k": 3},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('recommendations', [])
-                print(f"SUCCESS: Query '{query}': {len(results)} results")
-                if results:
-                    top_result = results[0]
-                    print(f"   Top result: {top_result.get('title', 'No title')[:50]}...")
-                    print(f"   Similarity: {top_result.get('similarity_score', 0):.3f}")
-            else:
-                print(f"ERROR: Query '{query}' failed: {response.status_code}")
-        except Exception as e:
-            print(f"ERROR: Query '{query}' error: {e}")
-    
-    # Test 4: AI Description Generation
-    print("\n4. Testing AI Description Generation...")
-    try:
-        response = requests.post(
-            f"{base_url}/api/v1/products/generate-description",
-            json={
-                "title": "Modern Leather Sofa",
-                "brand": "TestBrand",
-                "material": "Leather",
-                "price": "$299.99"
-            },
-            timeout=15
-        )
-        if response.status_code == 200:
-            data = response.json()
-            description = data.get('description', '')
-            print(f"SUCCESS: AI Description generated: {len(description)} characters")
-            print(f"   Preview: {description[:100]}...")
-        else:
-            print(f"ERROR: AI Description generation failed: {response.status_code}")
-    except Exception as e:
-        print(f"ERROR: AI Description error: {e}")
-    
-    # Test 5: Analytics Data
-    print("\n5. Testing Analytics Data...")
-    try:
-        response = requests.get(f"{base_url}/api/v1/analytics/overview", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            analytics = data.get('data', {})
-            print(f"SUCCESS: Analytics working:")
-            print(f"   Total products: {analytics.get('total_products', 0)}")
-            print(f"   Average price: ${analytics.get('average_price', 0):.2f}")
-            print(f"   Top categories: {len(analytics.get('top_categories', []))}")
-        else:
-            print(f"ERROR: Analytics failed: {response.status_code}")
-    except Exception as e:
-        print(f"ERROR: Analytics error: {e}")
-    
-    # Test 6: Sample Products
-    print("\n6. Testing Sample Products...")
-    try:
-        response = requests.get(f"{base_url}/api/v1/products/sample", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            products = data.get('products', [])
-            print(f"SUCCESS: Sample products: {len(products)} products")
-            if products:
-                first_product = products[0]
-                print(f"   First product: {first_product.get('title', 'No title')[:50]}...")
-                print(f"   Price: {first_product.get('price', 'N/A')}")
-        else:
-            print(f"ERROR: Sample products failed: {response.status_code}")
-    except Exception as e:
-        print(f"ERROR: Sample products error: {e}")
-    
-    print("\n" + "=" * 60)
-    print("END-TO-END SYSTEM TEST COMPLETE")
-    print("=" * 60)
-    
-    print("\nSYSTEM STATUS SUMMARY:")
-    print("SUCCESS: Backend API: Working")
-    print("SUCCESS: Frontend: Accessible")
-    print("SUCCESS: Vector Search: Working")
-    print("SUCCESS: AI Description Generation: Working")
-    print("SUCCESS: Analytics: Working")
-    print("SUCCESS: Product Data: Available")
-    
-    print("\nREADY FOR DEMO!")
-    print(f"Frontend URL: {frontend_url}")
-    print(f"Backend API: {base_url}")
-    
-    return True
-
-if __name__ == "__main__":
-    test_complete_system()
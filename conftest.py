@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the system test suite.
+
+The backend and frontend are expected to be running locally (see
+start-project.bat); tests that need them are skipped when they are not.
+"""
+
+import os
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+
+
+@pytest.fixture(scope="session")
+def backend_url():
+    return BACKEND_URL
+
+
+@pytest.fixture(scope="session")
+def frontend_url():
+    return FRONTEND_URL
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """One pooled session with retries, shared by every test."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    ))
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def warm_backend(http_session, backend_url):
+    """Hit /health once so cold-start model loading is paid a single time."""
+    try:
+        response = http_session.get(f"{backend_url}/health", timeout=30)
+    except requests.RequestException as e:
+        pytest.skip(f"Backend not running at {backend_url}: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"Backend unhealthy at {backend_url}: {response.status_code}")
+    return http_session
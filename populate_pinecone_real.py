@@ -11,10 +11,21 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from dotenv import load_dotenv
-import pinecone
+try:
+    # gRPC client: HTTP/2 multiplexing + protobuf encoding beats REST/JSON
+    # for bulk upserts; requires the pinecone[grpc] extra.
+    from pinecone.grpc import PineconeGRPC as Pinecone
+    GRPC_ENABLED = True
+except ImportError:
+    from pinecone import Pinecone
+    GRPC_ENABLED = False
+from pinecone import ServerlessSpec
+import torch
 from sentence_transformers import SentenceTransformer
 import time
 import json
+import itertools
+import functools
 
 # Load environment variables
 load_dotenv()
@@ -23,6 +34,14 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def chunks(iterable, batch_size):
+    """Yield successive batch_size-sized lists from an iterable."""
+    it = iter(iterable)
+    chunk = list(itertools.islice(it, batch_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(it, batch_size))
+
 class PineconePopulator:
     """Handles population of Pinecone index with product data and embeddings."""
     
@@ -44,25 +63,33 @@ class PineconePopulator:
                 logger.error("PINECONE_API_KEY not found in .env")
                 return False
             
-            # Initialize Pinecone
-            pinecone.init(api_key=api_key, environment=environment)
-            
+            # Initialize Pinecone (gRPC client when available, REST otherwise)
+            self.pc = Pinecone(api_key=api_key)
+            logger.info(f"Using {'gRPC' if GRPC_ENABLED else 'REST'} Pinecone client.")
+
             # Check if index exists, create if not
-            existing_indexes = pinecone.list_indexes()
+            existing_indexes = self.pc.list_indexes()
             index_exists = any(idx.name == self.index_name for idx in existing_indexes)
-            
+
             if not index_exists:
                 logger.info(f"Creating new Pinecone index '{self.index_name}'...")
-                pinecone.create_index(
+                self.pc.create_index(
                     name=self.index_name,
                     dimension=self.dimension,
-                    metric="cosine"
+                    metric="cosine",
+                    spec=ServerlessSpec(cloud="aws", region=environment)
                 )
                 logger.info("Waiting for index to be ready...")
-                time.sleep(10)  # Give Pinecone time to initialize
+                deadline = time.time() + 30
+                while time.time() < deadline:
+                    if self.pc.describe_index(self.index_name).status['ready']:
+                        break
+                    time.sleep(0.5)
+                else:
+                    logger.warning("Index not ready after 30s, continuing anyway...")
             
-            # Connect to index
-            self.index = pinecone.Index(self.index_name)
+            # Connect to index with a thread pool so upserts can run in parallel
+            self.index = self.pc.Index(self.index_name, pool_threads=30)
             self.is_initialized = True
             logger.info(f"Pinecone index '{self.index_name}' ready.")
             return True
@@ -71,111 +98,226 @@ class PineconePopulator:
             logger.error(f"Error initializing Pinecone: {e}")
             return False
     
-    def load_embedding_model(self):
-        """Load the sentence transformer model."""
+    def load_embedding_model(self, model_dir: str = "models/all-MiniLM-L6-v2"):
+        """Load the sentence transformer model from a local snapshot.
+
+        The first run downloads from HuggingFace Hub and saves to model_dir;
+        later runs load the local copy and skip the Hub round-trip entirely.
+        """
         try:
-            logger.info("Loading SentenceTransformer model...")
-            self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            model_path = Path(model_dir)
+            if model_path.exists():
+                logger.info(f"Loading SentenceTransformer model from {model_dir} on {device}...")
+                self.embedding_model = SentenceTransformer(str(model_path), device=device)
+            else:
+                logger.info(f"Downloading SentenceTransformer model (first run) on {device}...")
+                self.embedding_model = SentenceTransformer(
+                    'sentence-transformers/all-MiniLM-L6-v2', device=device
+                )
+                model_path.parent.mkdir(parents=True, exist_ok=True)
+                self.embedding_model.save(str(model_path))
+                logger.info(f"Saved model snapshot to {model_dir}.")
+            self._optimize_embedding_model(device)
             logger.info("SentenceTransformer model loaded successfully.")
             return True
         except Exception as e:
             logger.error(f"Error loading embedding model: {e}")
             return False
+
+    def _optimize_embedding_model(self, device):
+        """Apply best-effort inference speedups; keep the plain model on failure."""
+        if device == 'cpu':
+            try:
+                # Dynamic int8 quantization of the linear layers gives a
+                # 1.5-3x CPU inference speedup with negligible quality loss
+                self.embedding_model = torch.quantization.quantize_dynamic(
+                    self.embedding_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Applied int8 dynamic quantization to embedding model.")
+                return
+            except Exception as e:
+                logger.warning(f"int8 quantization unavailable, trying torch.compile: {e}")
+        try:
+            if hasattr(torch, 'compile'):
+                transformer = self.embedding_model[0]
+                transformer.auto_model = torch.compile(
+                    transformer.auto_model, mode='reduce-overhead'
+                )
+                logger.info("Compiled embedding model with torch.compile.")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager model: {e}")
     
     def load_products_data(self, csv_path: str = "data/raw/intern_data_ikarus.csv"):
-        """Load product data from CSV."""
+        """Load product data from CSV, restricted to the columns we use."""
         try:
             logger.info(f"Loading products data from {csv_path}")
-            df = pd.read_csv(csv_path)
+            wanted = set(self.TEXT_COLUMNS) | {'uniq_id'}
+            # Everything is treated as text downstream, so parse as str and
+            # skip pandas' NaN-scanning pass; missing values come back as ''
+            df = pd.read_csv(
+                csv_path,
+                usecols=lambda col: col in wanted,
+                dtype=str,
+                keep_default_na=False,
+                na_filter=False,
+                engine='c'
+            )
             logger.info(f"Loaded {len(df)} products.")
             return df
         except Exception as e:
             logger.error(f"Error loading products data: {e}")
             return None
     
-    def prepare_product_text(self, row):
-        """Prepare text for embedding from product row."""
-        text_parts = []
-        
-        if pd.notna(row.get('title')):
-            text_parts.append(str(row['title']))
-        if pd.notna(row.get('description')):
-            text_parts.append(str(row['description']))
-        if pd.notna(row.get('brand')):
-            text_parts.append(f"Brand: {row['brand']}")
-        if pd.notna(row.get('material')):
-            text_parts.append(f"Material: {row['material']}")
-        if pd.notna(row.get('categories')):
-            text_parts.append(f"Categories: {row['categories']}")
-        
-        return " ".join(text_parts)
+    TEXT_COLUMNS = ('title', 'description', 'brand', 'material', 'categories', 'price', 'images')
+
+    def _normalize_text_columns(self, df: pd.DataFrame):
+        """Fill missing values and coerce all relevant columns to str in place."""
+        for col in self.TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].fillna('').astype(str)
+            else:
+                df[col] = ''
+        # Truncate long fields once, column-wise, so the per-row metadata
+        # pass no longer allocates sliced copies
+        df['description'] = df['description'].str.slice(0, 1000)  # Limit description length
+        df['images'] = df['images'].str.slice(0, 500)  # Limit image URL length
+        return df
+
+    def _product_ids(self, df: pd.DataFrame):
+        """Extract product ids, falling back to positional ids where missing."""
+        fallback = pd.Series([f'product_{i}' for i in df.index], index=df.index)
+        if 'uniq_id' not in df.columns:
+            return fallback.tolist()
+        ids = df['uniq_id'].fillna('').astype(str)
+        return ids.where(ids != '', fallback).tolist()
+
+    def prepare_product_texts(self, df: pd.DataFrame):
+        """Build the combined embedding texts for all rows at once.
+
+        Operates on whole columns instead of per-row Series, so labels are
+        only attached where the field is non-empty, as before.
+        """
+        brand = np.where(df['brand'] != '', 'Brand: ' + df['brand'], '')
+        material = np.where(df['material'] != '', 'Material: ' + df['material'], '')
+        categories = np.where(df['categories'] != '', 'Categories: ' + df['categories'], '')
+        texts = (df['title'] + ' ' + df['description'] + ' '
+                 + brand + ' ' + material + ' ' + categories)
+        # Collapse the gaps left by empty fields
+        return texts.str.split().str.join(' ').tolist()
     
-    def populate_pinecone(self, df: pd.DataFrame, batch_size: int = 50):
-        """Generate embeddings and populate Pinecone with all products."""
+    def populate_pinecone(self, df: pd.DataFrame, document_chunk_size: int = 1000,
+                          batch_size: int = 64):
+        """Generate embeddings and populate Pinecone with all products.
+
+        Rows are processed in chunks of document_chunk_size: each chunk is
+        encoded in one batched call, then upserted in batches of batch_size.
+        """
         if not self.is_initialized:
             logger.error("Pinecone not initialized.")
             return False
-        
-        logger.info("Generating embeddings and uploading to Pinecone...")
-        vectors_to_upsert = []
-        
-        for idx, row in df.iterrows():
-            try:
-                product_id = str(row.get('uniq_id', f'product_{idx}'))
-                
-                # Prepare text for embedding
-                combined_text = self.prepare_product_text(row)
-                
-                # Generate embedding
-                embedding = self.embedding_model.encode([combined_text])[0]
-                
-                # Prepare metadata
-                metadata = {
-                    'title': str(row.get('title', '')),
-                    'brand': str(row.get('brand', '')),
-                    'price': str(row.get('price', '')),
-                    'categories': str(row.get('categories', '')),
-                    'material': str(row.get('material', '')),
-                    'description': str(row.get('description', ''))[:1000],  # Limit description length
-                    'image': str(row.get('images', ''))[:500]  # Limit image URL length
-                }
-                
-                vectors_to_upsert.append({
-                    'id': product_id,
-                    'values': embedding.tolist(),
-                    'metadata': metadata
-                })
-                
-                # Upload in batches
-                if len(vectors_to_upsert) >= batch_size:
-                    self.index.upsert(vectors=vectors_to_upsert)
-                    logger.info(f"Uploaded batch {len(vectors_to_upsert)} vectors")
-                    vectors_to_upsert = []
-                    
-            except Exception as e:
-                logger.warning(f"Error processing product {idx}: {e}")
-                continue
-        
-        # Upload remaining vectors
-        if vectors_to_upsert:
-            self.index.upsert(vectors=vectors_to_upsert)
-            logger.info(f"Uploaded final batch of {len(vectors_to_upsert)} vectors")
-        
-        logger.info(f"Successfully populated Pinecone with {len(df)} products.")
-        return True
+
+        try:
+            df = self._normalize_text_columns(df)
+
+            num_chunks = max(1, int(np.ceil(len(df) / document_chunk_size)))
+            for chunk_num, start in enumerate(range(0, len(df), document_chunk_size), start=1):
+                chunk_df = df.iloc[start:start + document_chunk_size]
+                logger.info(f"Processing chunk {chunk_num}/{num_chunks} ({len(chunk_df)} products)...")
+                ids = self._product_ids(chunk_df)
+                texts = self.prepare_product_texts(chunk_df)
+                # itertuples yields lightweight namedtuples instead of building
+                # a Series per row like iterrows
+                metadatas = [
+                    {
+                        'title': t.title,
+                        'brand': t.brand,
+                        'price': t.price,
+                        'categories': t.categories,
+                        'material': t.material,
+                        'description': t.description,
+                        'image': t.images
+                    }
+                    for t in chunk_df.itertuples(index=False)
+                ]
+
+                # Encode the whole chunk in one batched call. Normalized
+                # embeddings make cosine similarity a plain dot product on the
+                # Pinecone side.
+                embeddings = self.embedding_model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=True
+                )
+
+                def gen_vectors():
+                    for product_id, embedding, metadata in zip(ids, embeddings, metadatas):
+                        # The gRPC client serializes numpy float32 directly;
+                        # the REST client needs plain Python lists
+                        values = embedding if GRPC_ENABLED else embedding.tolist()
+                        yield {'id': product_id, 'values': values, 'metadata': metadata}
+
+                # Build vector dicts lazily and dispatch each batch as soon as
+                # it is sliced off the generator; round-trips overlap via
+                # async_req, then we block until every batch has landed. (The
+                # client's own iterator batching is synchronous, so we keep
+                # chunking here.)
+                pending = [
+                    (batch_vectors, self.index.upsert(vectors=batch_vectors, async_req=True))
+                    for batch_vectors in chunks(gen_vectors(), batch_size)
+                ]
+                for batch_vectors, async_result in pending:
+                    self._wait_for_upsert(batch_vectors, async_result)
+                    logger.info(f"Uploaded batch of {len(batch_vectors)} vectors")
+
+            logger.info(f"Successfully populated Pinecone with {len(df)} products.")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error populating Pinecone: {e}")
+            return False
+
+    def _wait_for_upsert(self, vectors, async_result, max_retries: int = 3):
+        """Wait for an async upsert, retrying with backoff if rate-limited."""
+        try:
+            # The gRPC client returns a concurrent.futures-style future; the
+            # REST client returns multiprocessing's ApplyResult
+            if GRPC_ENABLED:
+                return async_result.result()
+            return async_result.get()
+        except Exception as e:
+            error = e
+            for attempt in range(max_retries):
+                if 'RESOURCE_EXHAUSTED' not in str(error):
+                    raise error
+                wait = 2 ** attempt
+                logger.warning(f"Pinecone rate limit hit, retrying in {wait}s...")
+                time.sleep(wait)
+                try:
+                    return self.index.upsert(vectors=vectors)
+                except Exception as retry_error:
+                    error = retry_error
+            raise error
     
+    @functools.lru_cache(maxsize=1024)
+    def _encode_query(self, query: str):
+        """Encode a query string once; repeated queries hit the cache."""
+        return tuple(float(x) for x in self.embedding_model.encode([query])[0])
+
     def test_search(self, query: str = "modern leather sofa", top_k: int = 5):
         """Test search functionality."""
         try:
             if not self.index:
-                self.index = pinecone.Index(self.index_name)
-            
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode([query])[0]
-            
+                self.index = self.pc.Index(self.index_name)
+
+            # Generate query embedding (cached per query string)
+            query_embedding = self._encode_query(query)
+
             # Search
             results = self.index.query(
-                vector=query_embedding.tolist(),
+                vector=list(query_embedding),
                 top_k=top_k,
                 include_metadata=True
             )
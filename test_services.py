@@ -5,6 +5,7 @@ Test script to verify all services are working
 import sys
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent / "backend"))
@@ -40,27 +41,41 @@ def test_imports():
 def test_service_initialization():
     """Test service initialization"""
     print("\nTesting service initialization...")
-    
+
+    services = []
     try:
         from services.nlp_service import nlp_service
-        success = nlp_service.initialize()
-        print(f"SUCCESS: NLP service initialization: {'Success' if success else 'Failed'}")
+        services.append(("NLP", nlp_service))
     except Exception as e:
-        print(f"FAILED: NLP service initialization failed: {e}")
-    
+        print(f"FAILED: NLP service import failed: {e}")
+
     try:
         from services.cv_service import cv_service
-        success = cv_service.initialize()
-        print(f"SUCCESS: CV service initialization: {'Success' if success else 'Failed'}")
+        services.append(("CV", cv_service))
     except Exception as e:
-        print(f"FAILED: CV service initialization failed: {e}")
-    
+        print(f"FAILED: CV service import failed: {e}")
+
     try:
         from services.langchain_service import langchain_service
-        success = langchain_service.initialize()
-        print(f"SUCCESS: LangChain service initialization: {'Success' if success else 'Failed'}")
+        services.append(("LangChain", langchain_service))
     except Exception as e:
-        print(f"FAILED: LangChain service initialization failed: {e}")
+        print(f"FAILED: LangChain service import failed: {e}")
+
+    def initialize(item):
+        name, service = item
+        try:
+            return name, service.initialize(), None
+        except Exception as e:
+            return name, False, e
+
+    # Each initialize() is dominated by model downloads and disk I/O that
+    # release the GIL, so the three loads overlap in threads
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for name, success, error in executor.map(initialize, services):
+            if error is not None:
+                print(f"FAILED: {name} service initialization failed: {error}")
+            else:
+                print(f"SUCCESS: {name} service initialization: {'Success' if success else 'Failed'}")
 
 def test_basic_functionality():
     """Test basic functionality"""